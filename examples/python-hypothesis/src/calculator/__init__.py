@@ -11,21 +11,28 @@ This module demonstrates production-grade Python with:
 from calculator.core import Calculator
 from calculator.exceptions import (
     CalculatorError,
+    CalculatorOverflowError,
     DivisionByZeroError,
     InvalidInputError,
     OutOfRangeError,
-    OverflowError,
+    _deprecated_attribute,
 )
 from calculator.operations import (
     add,
+    add_array,
     divide,
+    divide_array,
     modulo,
+    modulo_array,
     multiply,
+    multiply_array,
     power,
     safe_divide,
     subtract,
+    subtract_array,
 )
 from calculator.validators import (
+    validate_array,
     validate_non_zero,
     validate_number,
     validate_positive,
@@ -35,17 +42,23 @@ from calculator.validators import (
 __all__ = [
     "Calculator",
     "CalculatorError",
+    "CalculatorOverflowError",
     "DivisionByZeroError",
     "InvalidInputError",
     "OutOfRangeError",
-    "OverflowError",
     "add",
+    "add_array",
     "divide",
+    "divide_array",
     "modulo",
+    "modulo_array",
     "multiply",
+    "multiply_array",
     "power",
     "safe_divide",
     "subtract",
+    "subtract_array",
+    "validate_array",
     "validate_non_zero",
     "validate_number",
     "validate_positive",
@@ -53,3 +66,7 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> type[CalculatorOverflowError]:
+    return _deprecated_attribute(__name__, name)
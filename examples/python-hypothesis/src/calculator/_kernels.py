@@ -0,0 +1,158 @@
+"""
+Scalar arithmetic kernels compiled to native code with Numba.
+
+Kernels never raise: each returns a ``(result, status)`` pair and the
+public wrappers in ``calculator.operations`` translate a non-zero status
+into the matching calculator exception.
+
+Each kernel is resolved once, at import, in order of preference:
+
+1. The ahead-of-time compiled ``calculator._native`` extension, built
+   with ``python -m calculator._kernels_aot``; no compilation at all.
+2. Numba's JIT, eagerly compiled for the declared signature and cached
+   on disk.
+3. Plain Python.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+try:
+    _native: Any = importlib.import_module("calculator._native")
+except ImportError:
+    _native = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+# Status codes returned alongside each kernel result
+OK = 0
+OVERFLOW = 1
+DIVISION_BY_ZERO = 2
+INVALID = 3
+
+BINARY_SIGNATURE = "Tuple((float64, int64))(float64, float64)"
+
+# Inputs are validated as finite, so a result is only non-finite after
+# overflow. `x * 0.0 != 0.0` holds exactly for NaN and +/-Inf and is used
+# below in place of math.isinf.
+
+# Operation codes understood by run_ops_kernel (shared with calculator.core._Op)
+OP_ADD = 1
+OP_SUBTRACT = 2
+OP_MULTIPLY = 3
+OP_DIVIDE = 4
+
+# Pure-Python source and signature of every kernel, for the AOT build
+KERNELS: dict[str, tuple[Callable[..., Any], str]] = {}
+
+
+def _jit(signature: str) -> Callable[[F], F]:
+    """Register a kernel and return its fastest available implementation."""
+
+    def decorate(func: F) -> F:
+        KERNELS[func.__name__] = (func, signature)
+        compiled = getattr(_native, func.__name__, None)
+        if compiled is not None:
+            return cast("F", compiled)
+        if not NUMBA_AVAILABLE:  # pragma: no cover - depends on the environment
+            return func
+        # Kernels check their own divisors, so the numpy error model lets
+        # Numba drop its implicit ZeroDivisionError checks on / and %.
+        return cast("F", njit(signature, cache=True, error_model="numpy")(func))
+
+    return decorate
+
+
+@_jit(BINARY_SIGNATURE)
+def add_kernel(a: float, b: float) -> tuple[float, int]:
+    """Compute a + b."""
+    result = a + b
+    if result * 0.0 != 0.0:
+        return result, OVERFLOW
+    return result, OK
+
+
+@_jit(BINARY_SIGNATURE)
+def subtract_kernel(a: float, b: float) -> tuple[float, int]:
+    """Compute a - b."""
+    result = a - b
+    if result * 0.0 != 0.0:
+        return result, OVERFLOW
+    return result, OK
+
+
+@_jit(BINARY_SIGNATURE)
+def multiply_kernel(a: float, b: float) -> tuple[float, int]:
+    """Compute a * b; IEEE-754 multiplication yields +/-inf on overflow."""
+    result = a * b
+    if result * 0.0 != 0.0:
+        return result, OVERFLOW
+    return result, OK
+
+
+@_jit(BINARY_SIGNATURE)
+def divide_kernel(a: float, b: float) -> tuple[float, int]:
+    """Compute a / b."""
+    if b == 0:
+        return math.nan, DIVISION_BY_ZERO
+    result = a / b
+    if result * 0.0 != 0.0:
+        return result, OVERFLOW
+    return result, OK
+
+
+@_jit(BINARY_SIGNATURE)
+def modulo_kernel(a: float, b: float) -> tuple[float, int]:
+    """Compute a % b with Python's sign-of-divisor semantics."""
+    if b == 0:
+        return math.nan, DIVISION_BY_ZERO
+    return a % b, OK
+
+
+@_jit("Tuple((float64, int64, int64))(float64, int8[::1], float64[::1], float64[::1])")
+def run_ops_kernel(
+    initial: float, opcodes: Any, operands: Any, values_out: Any
+) -> tuple[float, int, int]:
+    """
+    Apply a sequence of basic operations to initial in one loop.
+
+    Operands must already be validated as finite. Each intermediate value
+    is written to values_out. Returns ``(value, status, index)``: on
+    success the final value, OK and the number of operations; on failure
+    the value before the failing operation, its status and its index.
+    """
+    value = initial
+    for i in range(opcodes.shape[0]):
+        op = opcodes[i]
+        # float() keeps the plain-Python fallback off NumPy scalar arithmetic
+        operand = float(operands[i])
+        if op == OP_ADD:
+            result = value + operand
+        elif op == OP_SUBTRACT:
+            result = value - operand
+        elif op == OP_MULTIPLY:
+            result = value * operand
+        elif op == OP_DIVIDE:
+            if operand == 0:
+                return value, DIVISION_BY_ZERO, i
+            result = value / operand
+        else:
+            return value, INVALID, i
+        if result * 0.0 != 0.0:
+            return value, OVERFLOW, i
+        values_out[i] = result
+        value = result
+    return value, OK, opcodes.shape[0]
@@ -0,0 +1,40 @@
+"""
+Ahead-of-time build of the arithmetic kernels.
+
+Compiles every kernel registered in ``calculator._kernels`` into the
+``calculator._native`` extension module with Numba's ``pycc``, so that
+importing the calculator never pays JIT compilation cost::
+
+    python -m calculator._kernels_aot
+
+Rebuild after changing a kernel; kernels missing from a stale build fall
+back to the JIT.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from numba.pycc.cc import CC
+
+from calculator._kernels import KERNELS
+
+MODULE_NAME = "_native"
+
+
+def build(output_dir: Path | None = None) -> None:
+    """
+    Compile the kernels into a native extension module.
+
+    Args:
+        output_dir: Directory for the extension (default: the calculator package)
+    """
+    cc = CC(MODULE_NAME)  # type: ignore[no-untyped-call]
+    cc.output_dir = str(output_dir or Path(__file__).parent)
+    for name, (func, signature) in KERNELS.items():
+        cc.export(name, signature)(func)  # type: ignore[no-untyped-call]
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -2,18 +2,82 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from calculator.exceptions import CalculatorError
-from calculator.operations import add, divide, multiply, power, subtract
-from calculator.validators import validate_number
+from enum import IntEnum
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
+
+from calculator._kernels import (
+    DIVISION_BY_ZERO,
+    OP_ADD,
+    OP_DIVIDE,
+    OP_MULTIPLY,
+    OP_SUBTRACT,
+    run_ops_kernel,
+)
+from calculator.exceptions import (
+    CalculatorError,
+    CalculatorOverflowError,
+    DivisionByZeroError,
+    InvalidInputError,
+)
+from calculator.operations import power
+from calculator.validators import validate_array, validate_number
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
+
+    from numpy.typing import ArrayLike
+
+
+class _Op(IntEnum):
+    """Operation codes stored in history in place of operation names."""
+
+    INIT = 0
+    ADD = OP_ADD
+    SUBTRACT = OP_SUBTRACT
+    MULTIPLY = OP_MULTIPLY
+    DIVIDE = OP_DIVIDE
+    POWER = 5
+    CLEAR = 6
+    SET = 7
+
+
+# Operation names indexed by _Op code
+_OP_NAMES = tuple(op.name.lower() for op in _Op)
+
+# Operations accepted by Calculator.batch_apply, and their overflow labels
+_BATCH_OPS = {
+    "add": _Op.ADD,
+    "subtract": _Op.SUBTRACT,
+    "multiply": _Op.MULTIPLY,
+    "divide": _Op.DIVIDE,
+}
+_OVERFLOW_LABELS = {
+    _Op.ADD: "addition",
+    _Op.SUBTRACT: "subtraction",
+    _Op.MULTIPLY: "multiplication",
+    _Op.DIVIDE: "division",
+}
+
+
+def _float_operand(value: float, current: float, operation: str) -> float:
+    """
+    Validate an operand that is not an exact finite float and convert it.
+
+    Converting before the arithmetic keeps NumPy scalars out of it, where
+    an overflow would emit a RuntimeWarning rather than quietly give inf.
+    """
+    validate_number(value)
+    try:
+        return float(value)
+    except OverflowError as e:
+        raise CalculatorOverflowError(operation, current, value) from e
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorState:
     """Immutable state for calculator history."""
 
@@ -25,6 +89,146 @@ class CalculatorState:
         return f"{self.operation}({', '.join(map(str, self.operands))}) = {self.value}"
 
 
+class _History:
+    """
+    Bounded calculator history stored as parallel lists.
+
+    Values and operation codes live in lists next to a list of operand
+    tuples. Storage grows by appending up to maxlen and then acts as a
+    ring buffer that overwrites the oldest entry. CalculatorState objects
+    are only built when an entry is read; the newest one is cached, since
+    it is the entry read most often.
+    """
+
+    __slots__ = ("_last", "_len", "_maxlen", "_operands", "_operations", "_start", "_values")
+
+    def __init__(self, maxlen: int) -> None:
+        self._maxlen = maxlen
+        self._values: list[float] = []
+        self._operations: list[int] = []
+        self._operands: list[tuple[float, ...]] = []
+        self._start = 0
+        self._len = 0
+        self._last: CalculatorState | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> CalculatorState:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("history index out of range")
+        newest = index == self._len - 1
+        if newest and self._last is not None:
+            return self._last
+
+        slot = (self._start + index) % len(self._values)
+        state = CalculatorState(
+            self._values[slot],
+            _OP_NAMES[self._operations[slot]],
+            self._operands[slot],
+        )
+        if newest:
+            self._last = state
+        return state
+
+    def __iter__(self) -> Iterator[CalculatorState]:
+        for index in range(self._len):
+            yield self[index]
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (negative counts from the end) to a storage slot."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("history index out of range")
+        return (self._start + index) % len(self._values)
+
+    def value_at(self, index: int) -> float:
+        """Value recorded at index, without building a CalculatorState."""
+        return self._values[self._slot(index)]
+
+    def append(self, value: float, operation: int, operands: tuple[float, ...]) -> None:
+        """Record an entry, discarding the oldest one when full."""
+        self._last = None
+        capacity = len(self._values)
+        if self._len == capacity < self._maxlen:
+            # Storage only wraps once it reaches maxlen, so _start is 0 here
+            self._values.append(value)
+            self._operations.append(operation)
+            self._operands.append(operands)
+            self._len += 1
+            return
+
+        slot = (self._start + self._len) % capacity
+        self._values[slot] = value
+        self._operations[slot] = operation
+        self._operands[slot] = operands
+
+        if self._len == capacity:
+            self._start = (self._start + 1) % capacity
+        else:
+            self._len += 1
+
+    def pop(self) -> None:
+        """Remove the most recent entry."""
+        if not self._len:
+            raise IndexError("pop from empty history")
+        self._last = None
+        self._len -= 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._values.clear()
+        self._operations.clear()
+        self._operands.clear()
+        self._start = 0
+        self._len = 0
+        self._last = None
+
+    def copy(self) -> _History:
+        """Return an independent copy."""
+        new = _History.__new__(_History)
+        new._maxlen = self._maxlen
+        new._values = self._values.copy()
+        new._operations = self._operations.copy()
+        new._operands = self._operands.copy()
+        new._start = self._start
+        new._len = self._len
+        new._last = self._last
+        return new
+
+
+class _HistoryView(Sequence[CalculatorState]):
+    """Read-only live view of a calculator's history."""
+
+    __slots__ = ("_history",)
+
+    def __init__(self, history: _History) -> None:
+        self._history = history
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    @overload
+    def __getitem__(self, index: int) -> CalculatorState: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CalculatorState]: ...
+
+    def __getitem__(self, index: int | slice) -> CalculatorState | list[CalculatorState]:
+        if isinstance(index, slice):
+            return [self._history[i] for i in range(*index.indices(len(self._history)))]
+        return self._history[index]
+
+    def __iter__(self) -> Iterator[CalculatorState]:
+        return iter(self._history)
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self._history)!r})"
+
+
 class Calculator:
     """
     A stateful calculator with history and chain operations.
@@ -43,20 +247,28 @@ class Calculator:
         15.0
     """
 
-    def __init__(self, initial_value: float = 0.0) -> None:
+    __slots__ = ("_history", "_track_history", "_value")
+
+    #: Number of history entries kept; older entries are discarded.
+    MAX_HISTORY = 1024
+
+    def __init__(self, initial_value: float = 0.0, track_history: bool = True) -> None:
         """
         Initialize calculator with a starting value.
 
         Args:
             initial_value: The initial value (default 0.0)
+            track_history: Whether to record history; disable when only the
+                final value matters (undo is then unavailable)
 
         Raises:
             InvalidInputError: If initial_value is invalid
         """
         validate_number(initial_value)
-        self._value = float(initial_value)
-        self._history: list[CalculatorState] = []
-        self._record_state("init", initial_value)
+        self._value = initial_value if type(initial_value) is float else float(initial_value)
+        self._track_history = track_history
+        self._history = _History(self.MAX_HISTORY)
+        self._record_state(_Op.INIT, (initial_value,))
 
     @property
     def value(self) -> float:
@@ -64,61 +276,158 @@ class Calculator:
         return self._value
 
     @property
-    def history(self) -> list[CalculatorState]:
-        """List of all operations performed."""
-        return self._history.copy()
-
-    def _record_state(self, operation: str, *operands: float) -> None:
-        """Record current state to history."""
-        self._history.append(
-            CalculatorState(
-                value=self._value,
-                operation=operation,
-                operands=operands,
-            )
-        )
+    def history(self) -> Sequence[CalculatorState]:
+        """
+        The most recent operations performed, oldest first.
+
+        This is a read-only view that reflects later operations; take
+        list(calc.history) for a snapshot.
+        """
+        return _HistoryView(self._history)
+
+    @property
+    def track_history(self) -> bool:
+        """Whether operations are recorded to history."""
+        return self._track_history
+
+    def _record_state(self, operation: _Op, operands: tuple[float, ...] = ()) -> None:
+        """Record current state to history, if tracking is enabled."""
+        if not self._track_history:
+            return
+        self._history.append(self._value, operation, operands)
 
     def _apply(
-        self, operation: Callable[[float, float], float], operand: float, op_name: str
+        self, operation: Callable[[float, float], float], operand: float, op: _Op
     ) -> Calculator:
         """Apply a binary operation and record it."""
         validate_number(operand)
         self._value = operation(self._value, operand)
-        self._record_state(op_name, operand)
+        self._record_state(op, (operand,))
         return self
 
+    # The four basic operations are inlined rather than going through
+    # _apply: the current value is always finite, so only the operand needs
+    # validating, and exact finite floats skip validate_number entirely.
+    # History records the operand as passed, not its float conversion.
+
     def add(self, value: float) -> Calculator:
         """Add value to current result."""
-        return self._apply(add, value, "add")
+        x = value
+        if type(x) is not float or x - x != 0.0:
+            x = _float_operand(value, self._value, "addition")
+        result = self._value + x
+        if result * 0.0 != 0.0:
+            raise CalculatorOverflowError("addition", self._value, value)
+        self._value = result
+        self._record_state(_Op.ADD, (value,))
+        return self
 
     def subtract(self, value: float) -> Calculator:
         """Subtract value from current result."""
-        return self._apply(subtract, value, "subtract")
+        x = value
+        if type(x) is not float or x - x != 0.0:
+            x = _float_operand(value, self._value, "subtraction")
+        result = self._value - x
+        if result * 0.0 != 0.0:
+            raise CalculatorOverflowError("subtraction", self._value, value)
+        self._value = result
+        self._record_state(_Op.SUBTRACT, (value,))
+        return self
 
     def multiply(self, value: float) -> Calculator:
         """Multiply current result by value."""
-        return self._apply(multiply, value, "multiply")
+        x = value
+        if type(x) is not float or x - x != 0.0:
+            x = _float_operand(value, self._value, "multiplication")
+        result = self._value * x
+        if result * 0.0 != 0.0:
+            raise CalculatorOverflowError("multiplication", self._value, value)
+        self._value = result
+        self._record_state(_Op.MULTIPLY, (value,))
+        return self
 
     def divide(self, value: float) -> Calculator:
         """Divide current result by value."""
-        return self._apply(divide, value, "divide")
+        x = value
+        if type(x) is not float or x - x != 0.0:
+            x = _float_operand(value, self._value, "division")
+        if x == 0:
+            raise DivisionByZeroError(self._value)
+        result = self._value / x
+        if result * 0.0 != 0.0:
+            raise CalculatorOverflowError("division", self._value, value)
+        self._value = result
+        self._record_state(_Op.DIVIDE, (value,))
+        return self
 
     def power(self, exponent: float) -> Calculator:
         """Raise current result to power."""
-        return self._apply(power, exponent, "power")
+        return self._apply(power, exponent, _Op.POWER)
+
+    def batch_apply(self, operations: Iterable[str], operands: ArrayLike) -> Calculator:
+        """
+        Apply a sequence of operations in a single compiled loop.
+
+        ``calc.batch_apply(["add", "multiply"], [5, 2])`` is equivalent to
+        ``calc.add(5).multiply(2)`` but runs the arithmetic in one kernel
+        call. The batch is atomic: if any operation fails, the calculator
+        is left unchanged.
+
+        Args:
+            operations: Operation names: "add", "subtract", "multiply" or "divide"
+            operands: One operand per operation
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            InvalidInputError: If an operation name or operand is invalid
+            DivisionByZeroError: If a division by zero occurs
+            CalculatorOverflowError: If any intermediate result would overflow
+        """
+        try:
+            opcodes = np.fromiter((_BATCH_OPS[name] for name in operations), dtype=np.int8)
+        except KeyError as e:
+            raise InvalidInputError(e.args[0], "Unsupported batch operation") from e
+        except TypeError as e:
+            # An unhashable name fails the lookup before KeyError can name it
+            raise InvalidInputError(operations, "Unsupported batch operation") from e
+
+        values = np.ascontiguousarray(validate_array(operands))
+        if values.shape != opcodes.shape:
+            raise InvalidInputError(operands, "Expected one operand per operation")
+
+        results = np.empty_like(values)
+        final, status, index = run_ops_kernel(self._value, opcodes, values, results)
+
+        if status:
+            operand = float(values[index])
+            if status == DIVISION_BY_ZERO:
+                raise DivisionByZeroError(float(final))
+            raise CalculatorOverflowError(
+                _OVERFLOW_LABELS[_Op(opcodes[index])], float(final), operand
+            )
+
+        if self._track_history:
+            for value, opcode, operand in zip(
+                results.tolist(), opcodes.tolist(), values.tolist(), strict=True
+            ):
+                self._history.append(value, opcode, (operand,))
+        self._value = float(final)
+        return self
 
     def clear(self) -> Calculator:
         """Reset to zero and clear history."""
         self._value = 0.0
         self._history.clear()
-        self._record_state("clear")
+        self._record_state(_Op.CLEAR)
         return self
 
     def set(self, value: float) -> Calculator:
         """Set current value directly."""
         validate_number(value)
-        self._value = float(value)
-        self._record_state("set", value)
+        self._value = value if type(value) is float else float(value)
+        self._record_state(_Op.SET, (value,))
         return self
 
     def undo(self) -> Calculator:
@@ -129,20 +438,22 @@ class Calculator:
             Self with previous state restored
 
         Raises:
-            CalculatorError: If no operations to undo
+            CalculatorError: If no operations to undo or history is not tracked
         """
+        if not self._track_history:
+            raise CalculatorError("Cannot undo without history tracking")
         if len(self._history) <= 1:
             raise CalculatorError("Nothing to undo")
 
         self._history.pop()  # Remove current state
         if self._history:
-            self._value = self._history[-1].value
+            self._value = self._history.value_at(-1)
 
         return self
 
     def copy(self) -> Calculator:
         """Create an independent copy of this calculator."""
-        new_calc = Calculator(self._value)
+        new_calc = Calculator(self._value, self._track_history)
         new_calc._history = self._history.copy()
         return new_calc
 
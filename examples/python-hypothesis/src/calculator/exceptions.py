@@ -1,15 +1,32 @@
 """Custom exceptions for the calculator module."""
 
+import warnings
 from typing import Any
 
 
 class CalculatorError(Exception):
     """Base exception for all calculator errors."""
 
-    def __init__(self, message: str, value: Any = None) -> None:
-        self.message = message
+    def __init__(self, message: str | None, value: Any = None) -> None:
+        # message may be None for subclasses that build it in _format_message
+        self._message = message
         self.value = value
-        super().__init__(self.message)
+        super().__init__(message)
+
+    @property
+    def message(self) -> str:
+        """Human-readable description of the error."""
+        if self._message is None:
+            self._message = self._format_message()
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        self._message = message
+
+    def _format_message(self) -> str:
+        """Build the message on first access when none was given."""
+        return type(self).__name__
 
     def __str__(self) -> str:
         if self.value is not None:
@@ -25,14 +42,19 @@ class DivisionByZeroError(CalculatorError):
         self.numerator = numerator
 
 
-class OverflowError(CalculatorError):
+class CalculatorOverflowError(CalculatorError):
     """Raised when a calculation results in overflow."""
 
     def __init__(self, operation: str, *operands: float) -> None:
-        super().__init__(f"Overflow in {operation}", operands)
+        super().__init__(None, operands)
+        # Keep the raw fields as args so repr() and pickling reflect them
+        self.args = (operation, *operands)
         self.operation = operation
         self.operands = operands
 
+    def _format_message(self) -> str:
+        return f"Overflow in {self.operation}"
+
 
 class InvalidInputError(CalculatorError):
     """Raised when input is invalid (NaN, Inf, wrong type)."""
@@ -48,7 +70,33 @@ class OutOfRangeError(CalculatorError):
     def __init__(
         self, value: float, min_val: float | None = None, max_val: float | None = None
     ) -> None:
-        range_str = f"[{min_val}, {max_val}]"
-        super().__init__(f"Value out of range {range_str}", value)
+        super().__init__(None, value)
+        # Keep the raw fields as args so repr() and pickling reflect them
+        self.args = (value, min_val, max_val)
         self.min_val = min_val
         self.max_val = max_val
+
+    def _format_message(self) -> str:
+        return f"Value out of range [{self.min_val}, {self.max_val}]"
+
+
+def _deprecated_attribute(module: str, name: str) -> type[CalculatorOverflowError]:
+    """
+    Resolve a deprecated module attribute for a module __getattr__.
+
+    OverflowError is the old name of CalculatorOverflowError. It shadows the
+    builtin wherever it is bound, so it is served lazily with a warning and
+    kept out of ``__all__`` rather than defined as a module global.
+    """
+    if name == "OverflowError":
+        warnings.warn(
+            f"{module}.OverflowError is deprecated; use CalculatorOverflowError",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        return CalculatorOverflowError
+    raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> type[CalculatorOverflowError]:
+    return _deprecated_attribute(__name__, name)
@@ -1,12 +1,56 @@
-"""Core arithmetic operations with overflow protection."""
-
-import math
+"""
+Core arithmetic operations with overflow protection.
+
+Operands are converted to float before the arithmetic runs, so every
+result is a float (``add(2, 3) == 5.0``) and ints beyond 2**53 are
+rounded. An int too large for a float raises CalculatorOverflowError.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from calculator._kernels import (
+    DIVISION_BY_ZERO,
+    add_kernel,
+    divide_kernel,
+    modulo_kernel,
+    multiply_kernel,
+    subtract_kernel,
+)
+from calculator.exceptions import (
+    CalculatorOverflowError,
+    DivisionByZeroError,
+    InvalidInputError,
+)
+from calculator.validators import FloatArray, validate_array, validate_number
+
+# Default safe_divide result; compared by identity to skip re-validating it
+_DEFAULT_RESULT = 0.0
+
+
+def _validate_pair(a: float, b: float, operation: str) -> tuple[float, float]:
+    """
+    Validate both operands of a binary operation and return them as floats.
 
-from calculator.exceptions import DivisionByZeroError, InvalidInputError, OverflowError
-from calculator.validators import validate_number
+    Exact floats and ints share a single finiteness test (x - x is 0 for
+    every int and finite float); anything else defers to validate_number so
+    the error raised is unchanged. Operands go through float() so the
+    kernels only ever see float64 values.
+    """
+    type_a = type(a)
+    type_b = type(b)
+    if not (
+        (type_a is float or type_a is int)
+        and (type_b is float or type_b is int)
+        and (a - a) + (b - b) == 0.0
+    ):
+        validate_number(a)
+        validate_number(b)
 
-# Threshold for overflow detection
-OVERFLOW_THRESHOLD = 1e307
+    try:
+        return float(a), float(b)
+    except OverflowError as e:
+        raise CalculatorOverflowError(operation, a, b) from e
 
 
 def add(a: float, b: float) -> float:
@@ -27,15 +71,14 @@ def add(a: float, b: float) -> float:
 
     Raises:
         InvalidInputError: If inputs are invalid
-        OverflowError: If result would overflow
+        CalculatorOverflowError: If result would overflow
     """
-    validate_number(a)
-    validate_number(b)
+    x, y = _validate_pair(a, b, "addition")
 
-    result = a + b
+    result, status = add_kernel(x, y)
 
-    if math.isinf(result):
-        raise OverflowError("addition", a, b)
+    if status:
+        raise CalculatorOverflowError("addition", a, b)
 
     return result
 
@@ -58,15 +101,14 @@ def subtract(a: float, b: float) -> float:
 
     Raises:
         InvalidInputError: If inputs are invalid
-        OverflowError: If result would overflow
+        CalculatorOverflowError: If result would overflow
     """
-    validate_number(a)
-    validate_number(b)
+    x, y = _validate_pair(a, b, "subtraction")
 
-    result = a - b
+    result, status = subtract_kernel(x, y)
 
-    if math.isinf(result):
-        raise OverflowError("subtraction", a, b)
+    if status:
+        raise CalculatorOverflowError("subtraction", a, b)
 
     return result
 
@@ -90,19 +132,14 @@ def multiply(a: float, b: float) -> float:
 
     Raises:
         InvalidInputError: If inputs are invalid
-        OverflowError: If result would overflow
+        CalculatorOverflowError: If result would overflow
     """
-    validate_number(a)
-    validate_number(b)
-
-    # Check for potential overflow before computing
-    if a != 0 and b != 0 and abs(a) > OVERFLOW_THRESHOLD / abs(b):
-        raise OverflowError("multiplication", a, b)
+    x, y = _validate_pair(a, b, "multiplication")
 
-    result = a * b
+    result, status = multiply_kernel(x, y)
 
-    if math.isinf(result):
-        raise OverflowError("multiplication", a, b)
+    if status:
+        raise CalculatorOverflowError("multiplication", a, b)
 
     return result
 
@@ -126,23 +163,21 @@ def divide(a: float, b: float) -> float:
     Raises:
         InvalidInputError: If inputs are invalid
         DivisionByZeroError: If b is zero
-        OverflowError: If result would overflow
+        CalculatorOverflowError: If result would overflow
     """
-    validate_number(a)
-    validate_number(b)
+    x, y = _validate_pair(a, b, "division")
 
-    if b == 0:
-        raise DivisionByZeroError(a)
-
-    result = a / b
+    result, status = divide_kernel(x, y)
 
-    if math.isinf(result):
-        raise OverflowError("division", a, b)
+    if status == DIVISION_BY_ZERO:
+        raise DivisionByZeroError(a)
+    if status:
+        raise CalculatorOverflowError("division", a, b)
 
     return result
 
 
-def safe_divide(a: float, b: float, default: float = 0.0) -> float:
+def safe_divide(a: float, b: float, default: float = _DEFAULT_RESULT) -> float:
     """
     Divide a by b, returning default if b is zero.
 
@@ -157,16 +192,13 @@ def safe_divide(a: float, b: float, default: float = 0.0) -> float:
     Returns:
         Quotient of a and b, or default if b is zero
     """
-    validate_number(a)
-    validate_number(b)
-    validate_number(default)
-
-    if b == 0:
-        return default
+    x, y = _validate_pair(a, b, "division")
+    if default is not _DEFAULT_RESULT:
+        validate_number(default)
 
-    result = a / b
+    result, status = divide_kernel(x, y)
 
-    if math.isinf(result):
+    if status:
         return default
 
     return result
@@ -190,25 +222,22 @@ def power(base: float, exponent: float) -> float:
 
     Raises:
         InvalidInputError: If inputs are invalid or computation is undefined
-        OverflowError: If result would overflow
+        CalculatorOverflowError: If result would overflow
     """
-    validate_number(base)
-    validate_number(exponent)
+    x, y = _validate_pair(base, exponent, "exponentiation")
 
     # Handle special cases
-    if base == 0 and exponent < 0:
+    if x == 0 and y < 0:
         raise InvalidInputError((base, exponent), "0 cannot be raised to negative power")
 
-    if base < 0 and not exponent.is_integer():
+    if x < 0 and not y.is_integer():
         raise InvalidInputError((base, exponent), "Negative base with non-integer exponent")
 
+    # float.__pow__ raises the builtin OverflowError instead of returning inf
     try:
-        result = math.pow(base, exponent)
-    except ValueError as e:
-        raise InvalidInputError((base, exponent), str(e)) from e
-
-    if math.isinf(result):
-        raise OverflowError("exponentiation", base, exponent)
+        result: float = x**y
+    except OverflowError as e:
+        raise CalculatorOverflowError("exponentiation", base, exponent) from e
 
     return result
 
@@ -232,10 +261,146 @@ def modulo(a: float, b: float) -> float:
         InvalidInputError: If inputs are invalid
         DivisionByZeroError: If b is zero
     """
-    validate_number(a)
-    validate_number(b)
+    x, y = _validate_pair(a, b, "modulo")
+
+    result, status = modulo_kernel(x, y)
 
-    if b == 0:
+    if status:
         raise DivisionByZeroError(a)
 
-    return a % b
+    return result
+
+
+def _first_flagged(a: FloatArray, b: FloatArray, mask: NDArray[np.bool_]) -> tuple[float, float]:
+    """Return the broadcast operand pair at the first position set in mask."""
+    index = int(np.argmax(mask))
+    x, y = np.broadcast_arrays(a, b)
+    return float(x.flat[index]), float(y.flat[index])
+
+
+def _check_array_divisor(dividend: FloatArray, divisor: FloatArray) -> None:
+    """Raise DivisionByZeroError for the first zero element of divisor."""
+    zero = divisor == 0
+    if zero.any():
+        # The mask has the divisor's shape; broadcast it so its flat index
+        # lines up with the broadcast operands _first_flagged reads from
+        shape = np.broadcast_shapes(dividend.shape, divisor.shape)
+        numerator, _ = _first_flagged(dividend, divisor, np.broadcast_to(zero, shape))
+        raise DivisionByZeroError(numerator)
+
+
+def _apply_ufunc(ufunc: np.ufunc, a: FloatArray, b: FloatArray, operation: str) -> FloatArray:
+    """Apply a binary ufunc to validated arrays and reject overflowed elements."""
+    # Overflow is detected from the FPU status flags the ufunc leaves set,
+    # so the result is only scanned to locate the culprit on failure
+    try:
+        with np.errstate(over="raise"):
+            result: FloatArray = ufunc(a, b)
+    except FloatingPointError as e:
+        with np.errstate(over="ignore"):
+            overflowed = np.isinf(ufunc(a, b))
+        raise CalculatorOverflowError(operation, *_first_flagged(a, b, overflowed)) from e
+
+    return result
+
+
+def add_array(a: ArrayLike, b: ArrayLike) -> FloatArray:
+    """
+    Element-wise add() over arrays, broadcasting like a NumPy ufunc.
+
+    Args:
+        a: First operand array
+        b: Second operand array
+
+    Returns:
+        Element-wise sum of a and b
+
+    Raises:
+        InvalidInputError: If any element is invalid
+        CalculatorOverflowError: If any element of the result would overflow
+    """
+    return _apply_ufunc(np.add, validate_array(a), validate_array(b), "addition")
+
+
+def subtract_array(a: ArrayLike, b: ArrayLike) -> FloatArray:
+    """
+    Element-wise subtract() over arrays, broadcasting like a NumPy ufunc.
+
+    Args:
+        a: Minuend array
+        b: Subtrahend array
+
+    Returns:
+        Element-wise difference of a and b
+
+    Raises:
+        InvalidInputError: If any element is invalid
+        CalculatorOverflowError: If any element of the result would overflow
+    """
+    return _apply_ufunc(np.subtract, validate_array(a), validate_array(b), "subtraction")
+
+
+def multiply_array(a: ArrayLike, b: ArrayLike) -> FloatArray:
+    """
+    Element-wise multiply() over arrays, broadcasting like a NumPy ufunc.
+
+    Args:
+        a: First factor array
+        b: Second factor array
+
+    Returns:
+        Element-wise product of a and b
+
+    Raises:
+        InvalidInputError: If any element is invalid
+        CalculatorOverflowError: If any element of the result would overflow
+    """
+    return _apply_ufunc(np.multiply, validate_array(a), validate_array(b), "multiplication")
+
+
+def divide_array(a: ArrayLike, b: ArrayLike) -> FloatArray:
+    """
+    Element-wise divide() over arrays, broadcasting like a NumPy ufunc.
+
+    Args:
+        a: Dividend array
+        b: Divisor array
+
+    Returns:
+        Element-wise quotient of a and b
+
+    Raises:
+        InvalidInputError: If any element is invalid
+        DivisionByZeroError: If any element of b is zero
+        CalculatorOverflowError: If any element of the result would overflow
+    """
+    dividend = validate_array(a)
+    divisor = validate_array(b)
+
+    _check_array_divisor(dividend, divisor)
+
+    return _apply_ufunc(np.true_divide, dividend, divisor, "division")
+
+
+def modulo_array(a: ArrayLike, b: ArrayLike) -> FloatArray:
+    """
+    Element-wise modulo() over arrays, broadcasting like a NumPy ufunc.
+
+    Args:
+        a: Dividend array
+        b: Divisor array
+
+    Returns:
+        Element-wise remainder of a divided by b, with the sign of b
+
+    Raises:
+        InvalidInputError: If any element is invalid
+        DivisionByZeroError: If any element of b is zero
+    """
+    dividend = validate_array(a)
+    divisor = validate_array(b)
+
+    _check_array_divisor(dividend, divisor)
+
+    result: FloatArray = np.mod(dividend, divisor)
+    return result
@@ -3,9 +3,13 @@
 import math
 from typing import TypeVar
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from calculator.exceptions import InvalidInputError, OutOfRangeError
 
 T = TypeVar("T", int, float)
+FloatArray = NDArray[np.float64]
 
 # Constants for numerical limits
 MAX_SAFE_VALUE = 1e308
@@ -25,6 +29,15 @@ def validate_number(value: T) -> T:
     Raises:
         InvalidInputError: If value is NaN, Inf, or not a number
     """
+    # Fast path for exact floats and ints: x - x is 0.0 for every finite
+    # float and NaN for NaN or +/-Inf, so one subtraction replaces both checks.
+    value_type = type(value)
+    if value_type is float:
+        if value - value == 0.0:
+            return value
+    elif value_type is int:
+        return value
+
     if not isinstance(value, (int, float)):
         raise InvalidInputError(value, f"Expected number, got {type(value).__name__}")
 
@@ -106,16 +119,42 @@ def validate_range(
     """
     validate_number(value)
 
-    if min_val is not None:
-        if inclusive and value < min_val:
-            raise OutOfRangeError(value, min_val, max_val)
-        if not inclusive and value <= min_val:
-            raise OutOfRangeError(value, min_val, max_val)
+    # Missing bounds become infinite so one chained comparison covers every case
+    low = -math.inf if min_val is None else min_val
+    high = math.inf if max_val is None else max_val
 
-    if max_val is not None:
-        if inclusive and value > max_val:
-            raise OutOfRangeError(value, min_val, max_val)
-        if not inclusive and value >= max_val:
-            raise OutOfRangeError(value, min_val, max_val)
+    in_range = low <= value <= high if inclusive else low < value < high
+    if not in_range:
+        raise OutOfRangeError(value, min_val, max_val)
 
     return value
+
+
+def validate_array(value: ArrayLike) -> FloatArray:
+    """
+    Convert a value to a float64 array and validate it in a single pass.
+
+    Args:
+        value: A scalar, sequence, or ndarray of numbers
+
+    Returns:
+        The value as a float64 ndarray
+
+    Raises:
+        InvalidInputError: If value is not numeric or contains NaN/Inf
+    """
+    try:
+        raw = np.asarray(value)
+    except (TypeError, ValueError) as e:
+        raise InvalidInputError(value, "Expected array of numbers") from e
+
+    # Check the kind before casting: a float64 cast would parse numeric
+    # strings such as "1", which the scalar operations reject
+    if raw.dtype.kind not in "biuf":
+        raise InvalidInputError(value, "Expected array of numbers")
+
+    array = raw.astype(np.float64, copy=False)
+    if not np.isfinite(array).all():
+        raise InvalidInputError(value, "NaN and Infinity are not allowed")
+
+    return array
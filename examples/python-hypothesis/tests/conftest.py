@@ -1,19 +1,102 @@
 """Pytest configuration and shared fixtures."""
 
+import hashlib
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
 import pytest
-from hypothesis import Verbosity, settings
+from hypothesis import Phase, Verbosity, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
 
-# Configure Hypothesis profiles
+# Configure Hypothesis profiles. Deadlines are disabled throughout so the
+# one-off cost of loading or compiling the Numba kernels never fails a test.
 settings.register_profile("ci", max_examples=200, deadline=None)
 settings.register_profile("dev", max_examples=50, deadline=None)
-settings.register_profile("debug", max_examples=10, verbosity=Verbosity.verbose)
+settings.register_profile("debug", max_examples=10, deadline=None, verbosity=Verbosity.verbose)
+
+# Fast lane: no example database and no shrinking, so failures surface
+# immediately without replay or shrink search
+settings.register_profile(
+    "ci_fast",
+    max_examples=50,
+    deadline=None,
+    database=None,
+    phases=[Phase.explicit, Phase.generate],
+)
 
 # Load profile from environment or default to "dev"
 import os
 
 profile = os.environ.get("HYPOTHESIS_PROFILE", "dev")
+
+# Give each pytest-xdist worker its own example database so parallel
+# workers never contend on the same directory
+worker = os.environ.get("PYTEST_XDIST_WORKER")
+if worker and settings.get_profile(profile).database is not None:
+    settings.register_profile(
+        f"{profile}-{worker}",
+        parent=settings.get_profile(profile),
+        database=DirectoryBasedExampleDatabase(f".hypothesis/examples-{worker}"),
+    )
+    profile = f"{profile}-{worker}"
+
 settings.load_profile(profile)
 
+# Modules compiled by --mypyc. operations.py is left out: mypyc enforces
+# its float annotations at call time, so non-numeric input would raise
+# TypeError instead of InvalidInputError.
+MYPYC_MODULES = ("validators.py",)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--mypyc",
+        action="store_true",
+        default=False,
+        help="run against calculator modules compiled with mypyc",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--mypyc"):
+        _use_mypyc_build()
+
+
+def _use_mypyc_build():
+    """
+    Put a mypyc-compiled copy of the calculator package first on sys.path.
+
+    The copy is built outside the source tree, keyed on a hash of the
+    sources, so it is only rebuilt when they change. If compilation fails
+    the tests run against the pure-Python package.
+    """
+    source = Path(__file__).parent.parent / "src" / "calculator"
+    digest = hashlib.sha256(sys.implementation.cache_tag.encode())
+    for path in sorted(source.glob("*.py")):
+        digest.update(path.read_bytes())
+    build = Path(tempfile.gettempdir()) / "calculator-mypyc" / digest.hexdigest()[:16]
+
+    if not (build / "calculator").exists():
+        try:
+            shutil.copytree(
+                source, build / "calculator", ignore=shutil.ignore_patterns("__pycache__")
+            )
+            subprocess.run(
+                [sys.executable, "-m", "mypyc", *(f"calculator/{m}" for m in MYPYC_MODULES)],
+                cwd=build,
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            shutil.rmtree(build, ignore_errors=True)
+            sys.stderr.write(f"mypyc build failed, using pure Python: {e}\n")
+            return
+
+    sys.path.insert(0, str(build))
+
 
 @pytest.fixture
 def calculator():
@@ -0,0 +1,58 @@
+"""Hypothesis strategies and settings shared by the property tests."""
+
+import math
+
+import numpy as np
+from hypothesis import HealthCheck, settings
+from hypothesis import strategies as st
+from hypothesis.extra import numpy as hnp
+
+# Custom strategies for safe numbers
+safe_floats = st.floats(
+    min_value=-1e100,
+    max_value=1e100,
+    allow_nan=False,
+    allow_infinity=False,
+)
+
+small_floats = st.floats(
+    min_value=-1e10,
+    max_value=1e10,
+    allow_nan=False,
+    allow_infinity=False,
+)
+
+positive_floats = st.floats(
+    min_value=1e-10,
+    max_value=1e10,
+    allow_nan=False,
+    allow_infinity=False,
+)
+
+non_zero_floats = st.floats(
+    min_value=-1e10,
+    max_value=1e10,
+    allow_nan=False,
+    allow_infinity=False,
+).filter(lambda x: abs(x) > 1e-10)
+
+# Operand tuples drawn as one strategy, for laws over two or three values
+safe_pairs = st.tuples(safe_floats, safe_floats)
+small_triples = st.tuples(small_floats, small_floats, small_floats)
+
+# Batches of operands for the vectorized operations: one draw checks a
+# property for every element pair in a single ufunc call
+BATCH_SIZE = 256
+safe_batches = hnp.arrays(np.float64, BATCH_SIZE, elements=safe_floats)
+dividend_batches = hnp.arrays(np.int64, 4 * BATCH_SIZE, elements=st.integers(-1000, 1000))
+divisor_batches = hnp.arrays(np.int64, 4 * BATCH_SIZE, elements=st.integers(1, 100))
+
+# Simple algebraic laws (identity, commutativity, self-inverse) need few
+# examples to find a bug; properties that probe boundaries get more.
+FAST = settings(max_examples=25, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+THOROUGH = settings(max_examples=200)
+
+# Fixed operands for single-operand laws that hold for every finite float
+# by IEEE-754 definition; random draws add nothing over these edge cases
+EDGE_FLOATS = [0.0, 1.0, -1.0, 1e-308, 1e308, -1e308, math.pi, math.e]
+NON_ZERO_EDGE_FLOATS = [x for x in EDGE_FLOATS if x != 0.0]
@@ -0,0 +1,45 @@
+"""
+Algebraic laws shared by several operations, checked once per operation.
+
+Each law is a single parametrized property so its strategies are built
+once rather than in a mirrored test per operation.
+"""
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from calculator import add, add_array, divide, multiply, multiply_array, subtract
+
+from .strategies import EDGE_FLOATS, FAST, safe_batches, safe_pairs
+
+
+@pytest.mark.property
+@pytest.mark.parametrize("op", [add_array, multiply_array])
+@FAST
+@given(a=safe_batches, b=safe_batches)
+def test_commutative_batch(op, a: np.ndarray, b: np.ndarray):
+    """op(a, b) == op(b, a), element-wise over a batch"""
+    assert np.array_equal(op(a, b), op(b, a))
+
+
+@pytest.mark.property
+@pytest.mark.parametrize("op", [add, multiply])
+@FAST
+@given(ab=safe_pairs)
+def test_commutative_scalar(op, ab: tuple[float, float]):
+    """op(a, b) == op(b, a) for the scalar kernels"""
+    a, b = ab
+    assert op(a, b) == op(b, a)
+
+
+@pytest.mark.property
+@pytest.mark.parametrize(
+    ("op", "identity"),
+    [(add, 0), (subtract, 0), (multiply, 1), (divide, 1)],
+    ids=["add", "subtract", "multiply", "divide"],
+)
+@pytest.mark.parametrize("a", EDGE_FLOATS)
+def test_right_identity(op, identity: float, a: float):
+    """op(a, identity) == a"""
+    assert op(a, identity) == a
@@ -5,6 +5,8 @@ Tests the stateful Calculator using Hypothesis stateful testing,
 which generates sequences of operations and verifies invariants.
 """
 
+import math
+
 import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
@@ -47,15 +49,14 @@ class TestCalculatorProperties:
         except Exception:
             pass  # Overflow acceptable
 
-    @given(initial=safe_floats, factor=small_floats)
+    @given(initial=small_floats, factor=small_floats)
     def test_multiply_then_divide_identity(self, initial: float, factor: float):
         """Multiplying then dividing returns to original (for factor != 0)."""
         assume(abs(factor) > 1e-10)
-        assume(abs(initial) < 1e5)
         calc = Calculator(initial)
         try:
             calc.multiply(factor).divide(factor)
-            assert abs(calc.value - initial) < 1e-6 * max(abs(initial), 1)
+            assert math.isclose(calc.value, initial, rel_tol=1e-6, abs_tol=1e-6)
         except Exception:
             pass
 
@@ -134,8 +135,6 @@ class CalculatorStateMachine(RuleBasedStateMachine):
     @invariant()
     def value_is_finite(self) -> None:
         """Value should always be finite."""
-        import math
-
         assert math.isfinite(self.calc.value)
 
     @invariant()
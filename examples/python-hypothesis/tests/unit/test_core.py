@@ -0,0 +1,273 @@
+"""Unit tests for the Calculator class."""
+
+import numpy as np
+import pytest
+
+from calculator import (
+    Calculator,
+    CalculatorError,
+    CalculatorOverflowError,
+    DivisionByZeroError,
+    InvalidInputError,
+)
+
+
+class TestOperations:
+    """Tests for the chained arithmetic methods."""
+
+    def test_chain(self):
+        assert Calculator(10).add(5).subtract(3).multiply(2).divide(4).value == 6.0
+
+    def test_power(self):
+        assert Calculator(2).power(10).value == 1024.0
+
+    @pytest.mark.parametrize("method", ["add", "subtract", "multiply", "divide"])
+    @pytest.mark.parametrize("operand", [float("nan"), float("inf"), "1", None])
+    def test_rejects_invalid_operand(self, method, operand):
+        calc = Calculator(1)
+        with pytest.raises(InvalidInputError):
+            getattr(calc, method)(operand)
+        assert calc.value == 1.0
+        assert len(calc.history) == 1
+
+    def test_add_overflow(self):
+        with pytest.raises(CalculatorOverflowError):
+            Calculator(1e308).add(1e308)
+
+    def test_multiply_overflow(self):
+        calc = Calculator(1e308)
+        with pytest.raises(CalculatorOverflowError):
+            calc.multiply(10)
+        assert calc.value == 1e308
+
+    def test_multiply_numpy_scalar_overflow(self):
+        # Under filterwarnings=error a NumPy overflow warning would fail here
+        with pytest.raises(CalculatorOverflowError):
+            Calculator(1e308).multiply(np.float64(10))
+
+    def test_int_too_large_for_float(self):
+        with pytest.raises(CalculatorOverflowError):
+            Calculator(1).add(2**1100)
+
+    def test_divide_by_zero(self):
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            Calculator(5).divide(0)
+        assert exc_info.value.numerator == 5.0
+
+    def test_accepts_bool_operand(self):
+        assert Calculator(1).add(True).value == 2.0
+
+
+class TestInitialValue:
+    """Tests for how initial and set values are stored."""
+
+    def test_int_is_promoted_to_float(self):
+        assert type(Calculator(3).value) is float
+
+    def test_float_subclass_is_converted(self):
+        assert type(Calculator(np.float64(1.5)).value) is float
+
+    def test_set_promotes_int(self):
+        assert type(Calculator().set(2).value) is float
+
+    def test_set_keeps_float(self):
+        value = 2.5
+        assert Calculator().set(value).value is value
+
+
+class TestHistory:
+    """Tests for Calculator history tracking."""
+
+    def test_initial_history(self):
+        calc = Calculator(5)
+        assert len(calc.history) == 1
+        assert calc.history[0].value == 5.0
+
+    def test_records_each_operation(self):
+        calc = Calculator(10).add(5).multiply(2)
+        assert [state.value for state in calc.history] == [10.0, 15.0, 30.0]
+
+    def test_history_is_bounded(self):
+        calc = Calculator()
+        for _ in range(Calculator.MAX_HISTORY + 10):
+            calc.add(1)
+        assert len(calc.history) == Calculator.MAX_HISTORY
+        assert calc.history[-1].value == calc.value
+
+    def test_history_is_read_only(self):
+        calc = Calculator(1)
+        with pytest.raises(AttributeError):
+            calc.history.clear()  # type: ignore[attr-defined]
+        assert len(calc.history) == 1
+
+    def test_history_view_is_live(self):
+        calc = Calculator(1)
+        history = calc.history
+        calc.add(1)
+        assert len(history) == 2
+        assert history[-1].value == 2.0
+
+    def test_latest_entry_follows_undo_and_clear(self):
+        calc = Calculator(1).add(1)
+        history = calc.history
+        assert history[-1].value == 2.0
+        calc.undo()
+        assert history[-1].value == 1.0
+        calc.add(5)
+        assert history[-1].value == 6.0
+        calc.clear()
+        assert [state.operation for state in history] == ["clear"]
+
+    def test_history_slicing(self):
+        calc = Calculator(1).add(1).add(1)
+        assert [state.value for state in calc.history[1:]] == [2.0, 3.0]
+
+    def test_history_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            Calculator().history[1]
+
+    def test_undo_restores_previous_value(self):
+        calc = Calculator(10).add(5)
+        assert calc.undo().value == 10.0
+
+    def test_undo_without_operations_raises(self):
+        with pytest.raises(CalculatorError):
+            Calculator(10).undo()
+
+    def test_history_order_after_wraparound(self):
+        calc = Calculator()
+        for _ in range(Calculator.MAX_HISTORY + 5):
+            calc.add(1)
+        values = [state.value for state in calc.history]
+        assert values == sorted(values)
+        assert values[0] == 6.0
+
+    def test_undo_after_wraparound(self):
+        calc = Calculator()
+        for _ in range(Calculator.MAX_HISTORY + 5):
+            calc.add(1)
+        assert calc.undo().value == Calculator.MAX_HISTORY + 4
+
+    def test_history_entry_fields(self):
+        state = Calculator(2).power(3).history[-1]
+        assert (state.value, state.operation, state.operands) == (8.0, "power", (3,))
+
+    def test_history_records_operands_as_passed(self):
+        calc = Calculator(1).add(3).subtract(3).multiply(3).divide(3).power(3)
+        operands = [state.operands for state in calc.history[1:]]
+        assert all(type(x) is int for (x,) in operands)
+
+    def test_copy_is_independent(self):
+        calc = Calculator(1).add(1)
+        clone = calc.copy()
+        calc.add(1)
+        assert [state.value for state in clone.history] == [1.0, 2.0]
+
+    def test_copy_keeps_history_bound(self):
+        calc = Calculator().copy()
+        for _ in range(Calculator.MAX_HISTORY + 1):
+            calc.add(1)
+        assert len(calc.history) == Calculator.MAX_HISTORY
+
+
+class TestBatchApply:
+    """Tests for applying many operations in one kernel call."""
+
+    def test_matches_chained_calls(self):
+        operations = ["add", "multiply", "subtract", "divide"] * 10
+        operands = [3.5, 1.5, 2.0, 0.75] * 10
+        expected = Calculator(1.0)
+        for name, operand in zip(operations, operands, strict=True):
+            getattr(expected, name)(operand)
+
+        calc = Calculator(1.0).batch_apply(operations, operands)
+
+        assert calc.value == expected.value
+        assert list(calc.history) == list(expected.history)
+
+    def test_accepts_numpy_operands(self):
+        calc = Calculator(0).batch_apply(["add"] * 3, np.array([1.0, 2.0, 3.0]))
+        assert calc.value == 6.0
+
+    def test_empty_batch(self):
+        calc = Calculator(5).batch_apply([], [])
+        assert calc.value == 5.0
+        assert len(calc.history) == 1
+
+    def test_undo_after_batch(self):
+        calc = Calculator(1).batch_apply(["add", "add"], [1, 1])
+        assert calc.undo().value == 2.0
+
+    def test_rejects_unknown_operation(self):
+        with pytest.raises(InvalidInputError):
+            Calculator().batch_apply(["power"], [2])
+
+    def test_rejects_unhashable_operation(self):
+        with pytest.raises(InvalidInputError):
+            Calculator().batch_apply([["add"]], [1])  # type: ignore[list-item]
+
+    def test_rejects_invalid_operand(self):
+        with pytest.raises(InvalidInputError):
+            Calculator().batch_apply(["add", "add"], [1.0, float("nan")])
+
+    def test_rejects_numeric_string_operand(self):
+        with pytest.raises(InvalidInputError):
+            Calculator().batch_apply(["add"], ["5"])
+
+    def test_rejects_length_mismatch(self):
+        with pytest.raises(InvalidInputError):
+            Calculator().batch_apply(["add", "add"], [1.0])
+
+    def test_division_by_zero_is_atomic(self):
+        calc = Calculator(10)
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            calc.batch_apply(["add", "divide"], [5, 0])
+        assert exc_info.value.numerator == 15.0
+        assert calc.value == 10.0
+        assert len(calc.history) == 1
+
+    def test_overflow_is_atomic(self):
+        calc = Calculator(1e308)
+        with pytest.raises(CalculatorOverflowError) as exc_info:
+            calc.batch_apply(["subtract", "multiply"], [1.0, 10.0])
+        assert exc_info.value.operation == "multiplication"
+        assert calc.value == 1e308
+        assert len(calc.history) == 1
+
+
+class TestWithoutHistory:
+    """Tests for calculators created with track_history=False."""
+
+    def test_operations_still_apply(self):
+        calc = Calculator(10, track_history=False).add(5).multiply(2)
+        assert calc.value == 30.0
+
+    def test_records_nothing(self):
+        calc = Calculator(10, track_history=False).add(5).set(1).clear()
+        assert len(calc.history) == 0
+
+    def test_batch_records_nothing(self):
+        calc = Calculator(10, track_history=False).batch_apply(["add"], [5])
+        assert calc.value == 15.0
+        assert len(calc.history) == 0
+
+    def test_undo_raises(self):
+        calc = Calculator(10, track_history=False).add(5)
+        with pytest.raises(CalculatorError):
+            calc.undo()
+
+    def test_copy_preserves_setting(self):
+        assert not Calculator(track_history=False).copy().track_history
+
+    def test_tracks_by_default(self):
+        assert Calculator().track_history
+
+
+class TestSlots:
+    """Calculator objects do not carry a per-instance __dict__."""
+
+    def test_calculator_has_no_dict(self):
+        assert not hasattr(Calculator(), "__dict__")
+
+    def test_state_has_no_dict(self):
+        assert not hasattr(Calculator().history[0], "__dict__")
@@ -0,0 +1,59 @@
+"""Unit tests for calculator exceptions."""
+
+import pickle
+
+import pytest
+
+from calculator import (
+    CalculatorError,
+    CalculatorOverflowError,
+    DivisionByZeroError,
+    OutOfRangeError,
+)
+
+
+class TestMessages:
+    """Messages are formatted from the exception's fields."""
+
+    def test_overflow_message(self):
+        error = CalculatorOverflowError("addition", 1e308, 1e308)
+        assert error.message == "Overflow in addition"
+        assert str(error) == "Overflow in addition: (1e+308, 1e+308)"
+
+    def test_out_of_range_message(self):
+        error = OutOfRangeError(11, 0, 10)
+        assert error.message == "Value out of range [0, 10]"
+        assert str(error) == "Value out of range [0, 10]: 11"
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            CalculatorError("failed"),
+            DivisionByZeroError(1.0),
+            CalculatorOverflowError("addition", 1.0, 2.0),
+            OutOfRangeError(11, 0, 10),
+        ],
+    )
+    def test_message_is_assignable(self, error):
+        error.message = "custom"
+        assert error.message == "custom"
+
+
+class TestArgs:
+    """Exception args carry the raw fields rather than a format template."""
+
+    def test_overflow_repr(self):
+        error = CalculatorOverflowError("multiplication", 1e308, 10)
+        assert repr(error) == "CalculatorOverflowError('multiplication', 1e+308, 10)"
+
+    def test_out_of_range_repr(self):
+        assert repr(OutOfRangeError(11, 0, 10)) == "OutOfRangeError(11, 0, 10)"
+
+    @pytest.mark.parametrize(
+        "error",
+        [CalculatorOverflowError("division", 1.0, 1e-308), OutOfRangeError(-1, 0, None)],
+    )
+    def test_pickle_round_trip(self, error):
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
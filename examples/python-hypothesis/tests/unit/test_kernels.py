@@ -0,0 +1,80 @@
+"""Unit tests for the native arithmetic kernels."""
+
+import math
+
+import pytest
+
+from calculator._kernels import (
+    DIVISION_BY_ZERO,
+    KERNELS,
+    OK,
+    OVERFLOW,
+    add_kernel,
+    divide_kernel,
+    modulo_kernel,
+    multiply_kernel,
+    subtract_kernel,
+)
+
+
+class TestKernelResults:
+    """Kernels return the arithmetic result with an OK status."""
+
+    @pytest.mark.parametrize(
+        ("kernel", "a", "b", "expected"),
+        [
+            (add_kernel, 2.0, 3.0, 5.0),
+            (subtract_kernel, 2.0, 3.0, -1.0),
+            (multiply_kernel, 2.0, 3.0, 6.0),
+            (divide_kernel, 3.0, 2.0, 1.5),
+            (modulo_kernel, -10.0, 3.0, 2.0),
+        ],
+    )
+    def test_result(self, kernel, a, b, expected):
+        assert kernel(a, b) == (expected, OK)
+
+    def test_accepts_int_arguments(self):
+        assert add_kernel(2, 3) == (5.0, OK)
+
+
+class TestKernelStatus:
+    """Kernels report failures through a status code instead of raising."""
+
+    def test_add_overflow(self):
+        assert add_kernel(1e308, 1e308)[1] == OVERFLOW
+
+    def test_subtract_overflow(self):
+        assert subtract_kernel(-1e308, 1e308)[1] == OVERFLOW
+
+    def test_multiply_overflow(self):
+        assert multiply_kernel(1e308, 10.0)[1] == OVERFLOW
+
+    def test_divide_overflow(self):
+        assert divide_kernel(1e308, 1e-308)[1] == OVERFLOW
+
+    def test_divide_by_zero(self):
+        result, status = divide_kernel(1.0, 0.0)
+        assert status == DIVISION_BY_ZERO
+        assert math.isnan(result)
+
+    def test_modulo_by_zero(self):
+        assert modulo_kernel(1.0, 0.0)[1] == DIVISION_BY_ZERO
+
+
+class TestKernelRegistry:
+    """Every kernel is registered for the ahead-of-time build."""
+
+    def test_kernels_registered(self):
+        assert set(KERNELS) == {
+            "add_kernel",
+            "subtract_kernel",
+            "multiply_kernel",
+            "divide_kernel",
+            "modulo_kernel",
+            "run_ops_kernel",
+        }
+
+    def test_registered_source_is_python(self):
+        func, signature = KERNELS["add_kernel"]
+        assert func(2.0, 3.0) == (5.0, OK)
+        assert signature.startswith("Tuple(")
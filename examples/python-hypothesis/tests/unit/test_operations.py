@@ -1,18 +1,26 @@
 """Unit tests for arithmetic operations."""
 
+import math
+
+import numpy as np
 import pytest
 
 from calculator import (
+    CalculatorOverflowError,
     DivisionByZeroError,
     InvalidInputError,
-    OverflowError,
     add,
+    add_array,
     divide,
+    divide_array,
     modulo,
+    modulo_array,
     multiply,
+    multiply_array,
     power,
     safe_divide,
     subtract,
+    subtract_array,
 )
 
 
@@ -36,6 +44,11 @@ class TestAdd:
         result = add(0.1, 0.2)
         assert abs(result - 0.3) < 1e-10
 
+    def test_add_ints_returns_float(self):
+        result = add(2, 3)
+        assert result == 5.0
+        assert type(result) is float
+
     def test_add_large_numbers(self):
         result = add(1e100, 1e100)
         assert result == 2e100
@@ -48,6 +61,47 @@ class TestAdd:
         with pytest.raises(InvalidInputError):
             add(float("inf"), 1)
 
+    def test_add_rejects_invalid_second_operand(self):
+        with pytest.raises(InvalidInputError) as exc_info:
+            add(1, float("nan"))
+        assert "NaN" in str(exc_info.value)
+
+    def test_add_rejects_non_number(self):
+        with pytest.raises(InvalidInputError):
+            add(1, "2")  # type: ignore
+
+
+class TestOverflowErrorAlias:
+    """The deprecated OverflowError name still refers to the calculator error."""
+
+    def test_alias(self):
+        with pytest.deprecated_call():
+            from calculator import OverflowError as LegacyOverflowError  # noqa: PLC0415
+
+        assert LegacyOverflowError is CalculatorOverflowError
+
+    def test_alias_from_exceptions_module(self):
+        with pytest.deprecated_call():
+            from calculator.exceptions import (  # noqa: PLC0415
+                OverflowError as LegacyOverflowError,
+            )
+
+        assert LegacyOverflowError is CalculatorOverflowError
+
+    def test_alias_not_star_exported(self):
+        import calculator  # noqa: PLC0415
+
+        assert "OverflowError" not in calculator.__all__
+
+    def test_unknown_attribute_still_raises(self):
+        import calculator  # noqa: PLC0415
+
+        with pytest.raises(AttributeError):
+            calculator.NoSuchName  # noqa: B018
+
+    def test_does_not_catch_builtin(self):
+        assert not issubclass(CalculatorOverflowError, OverflowError)
+
 
 class TestSubtract:
     """Tests for the subtract function."""
@@ -89,8 +143,25 @@ class TestMultiply:
         assert multiply(42, 1) == 42
 
     def test_multiply_overflow_protection(self):
-        with pytest.raises(OverflowError):
+        with pytest.raises(CalculatorOverflowError):
+            multiply(1e308, 10)
+
+    def test_multiply_overflow_message(self):
+        with pytest.raises(CalculatorOverflowError) as exc_info:
             multiply(1e308, 10)
+        assert str(exc_info.value) == "Overflow in multiplication: (1e+308, 10)"
+
+    def test_multiply_up_to_max_float(self):
+        assert multiply(1e154, 1e154) == 1e154 * 1e154
+
+    def test_multiply_negative_overflow(self):
+        with pytest.raises(CalculatorOverflowError):
+            multiply(-1e200, 1e200)
+
+    def test_multiply_int_too_large_for_float(self):
+        with pytest.raises(CalculatorOverflowError) as exc_info:
+            multiply(2**1100, 1)
+        assert exc_info.value.operands == (2**1100, 1)
 
 
 class TestDivide:
@@ -130,6 +201,10 @@ class TestSafeDivide:
     def test_safe_divide_custom_default(self):
         assert safe_divide(10, 0, default=-1) == -1
 
+    def test_safe_divide_rejects_invalid_default(self):
+        with pytest.raises(InvalidInputError):
+            safe_divide(10, 2, default=float("nan"))
+
     def test_safe_divide_overflow_returns_default(self):
         result = safe_divide(1e308, 1e-308)
         assert result == 0.0
@@ -164,6 +239,33 @@ class TestPower:
         with pytest.raises(InvalidInputError):
             power(-2, 0.5)
 
+    def test_power_negative_base_integer_exponent(self):
+        assert power(-2, 3) == -8
+        assert power(-2.0, 2.0) == 4
+
+    def test_power_matches_math_pow_for_integer_exponents(self):
+        for exponent in range(-64, 65):
+            assert power(1.1, exponent) == pytest.approx(math.pow(1.1, exponent), rel=1e-12)
+
+    def test_power_large_integer_exponent(self):
+        assert power(1.0001, 1000) == pytest.approx(math.pow(1.0001, 1000))
+
+    def test_power_subnormal_result(self):
+        assert power(1e155, -2) == 1e155**-2
+        assert power(1e155, -2) > 0
+
+    def test_power_overflow_protection(self):
+        with pytest.raises(CalculatorOverflowError):
+            power(1e200, 2)
+
+    def test_power_overflow_non_integer_exponent(self):
+        with pytest.raises(CalculatorOverflowError):
+            power(1e200, 2.5)
+
+    def test_power_overflow_large_integer_exponent(self):
+        with pytest.raises(CalculatorOverflowError):
+            power(10, 400)
+
 
 class TestModulo:
     """Tests for the modulo function."""
@@ -185,3 +287,86 @@ class TestModulo:
     def test_modulo_float(self):
         result = modulo(5.5, 2)
         assert abs(result - 1.5) < 1e-10
+
+
+class TestArrayOperations:
+    """Tests for the vectorized array operations."""
+
+    def test_add_array(self):
+        result = add_array(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
+        assert np.array_equal(result, [5.0, 7.0, 9.0])
+
+    def test_subtract_array(self):
+        result = subtract_array([5, 7, 9], [4, 5, 6])
+        assert np.array_equal(result, [1.0, 2.0, 3.0])
+
+    def test_multiply_array(self):
+        result = multiply_array([1.0, -2.0, 3.0], [4.0, 5.0, 0.0])
+        assert np.array_equal(result, [4.0, -10.0, 0.0])
+
+    def test_divide_array(self):
+        result = divide_array([10.0, 7.0, -10.0], [2.0, 2.0, 2.0])
+        assert np.array_equal(result, [5.0, 3.5, -5.0])
+
+    def test_modulo_array(self):
+        result = modulo_array([10.0, -7.0, 7.0], [3.0, 3.0, -3.0])
+        assert np.array_equal(result, [modulo(10, 3), modulo(-7, 3), modulo(7, -3)])
+
+    def test_broadcasts_scalar(self):
+        result = add_array([1.0, 2.0, 3.0], 1.0)
+        assert np.array_equal(result, [2.0, 3.0, 4.0])
+
+    def test_returns_float64(self):
+        assert add_array([1, 2], [3, 4]).dtype == np.float64
+
+    def test_matches_scalar_operations(self):
+        a = [0.1, -2.5, 1e100, 7.0]
+        b = [0.2, 3.5, -1e100, 3.0]
+        expected = [divide(x, y) for x, y in zip(a, b, strict=True)]
+        assert np.array_equal(divide_array(a, b), expected)
+
+    def test_rejects_nan(self):
+        with pytest.raises(InvalidInputError):
+            add_array([1.0, float("nan")], [1.0, 2.0])
+
+    def test_rejects_inf(self):
+        with pytest.raises(InvalidInputError):
+            multiply_array([1.0, 2.0], [float("inf"), 2.0])
+
+    def test_rejects_non_numeric(self):
+        with pytest.raises(InvalidInputError):
+            add_array(["a", "b"], [1.0, 2.0])
+
+    def test_rejects_numeric_strings(self):
+        with pytest.raises(InvalidInputError):
+            add_array(["1"], ["2"])
+
+    def test_overflow_protection(self):
+        with pytest.raises(CalculatorOverflowError) as exc_info:
+            multiply_array([1.0, 1e308], [2.0, 10.0])
+        assert exc_info.value.operands == (1e308, 10.0)
+
+    def test_divide_overflow_protection(self):
+        with pytest.raises(CalculatorOverflowError) as exc_info:
+            divide_array([1.0, -1e308, 1e308], [1.0, 1e-10, 2.0])
+        assert exc_info.value.operands == (-1e308, 1e-10)
+
+    def test_divide_by_zero_raises(self):
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            divide_array([1.0, 2.0], [1.0, 0.0])
+        assert exc_info.value.numerator == 2.0
+
+    def test_divide_by_broadcast_zero_reports_numerator(self):
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            divide_array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], [[1.0], [0.0]])
+        assert exc_info.value.numerator == 4.0
+
+    def test_modulo_by_zero_raises(self):
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            modulo_array([1.0, 2.0], 0.0)
+        assert exc_info.value.numerator == 1.0
+
+    def test_modulo_by_broadcast_zero_reports_numerator(self):
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            modulo_array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], [[1.0], [0.0]])
+        assert exc_info.value.numerator == 4.0
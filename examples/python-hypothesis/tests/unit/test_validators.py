@@ -1,10 +1,12 @@
 """Unit tests for validator functions."""
 
+import numpy as np
 import pytest
 
 from calculator import (
     InvalidInputError,
     OutOfRangeError,
+    validate_array,
     validate_non_zero,
     validate_number,
     validate_positive,
@@ -49,6 +51,22 @@ class TestValidateNumber:
         with pytest.raises(InvalidInputError):
             validate_number(None)  # type: ignore
 
+    def test_accepts_bool(self):
+        assert validate_number(True) is True
+
+    def test_accepts_float_subclass(self):
+        class Float(float):
+            pass
+
+        assert validate_number(Float(1.5)) == 1.5
+
+    def test_rejects_nan_float_subclass(self):
+        class Float(float):
+            pass
+
+        with pytest.raises(InvalidInputError):
+            validate_number(Float("nan"))
+
 
 class TestValidatePositive:
     """Tests for validate_positive function."""
@@ -137,3 +155,37 @@ class TestValidateRange:
         assert validate_range(-100, max_val=0) == -100
         with pytest.raises(OutOfRangeError):
             validate_range(1, max_val=0)
+
+    def test_exclusive_without_bounds(self):
+        assert validate_range(0, inclusive=False) == 0
+
+    def test_exclusive_inside_range(self):
+        assert validate_range(5, min_val=0, max_val=10, inclusive=False) == 5
+
+    def test_error_reports_range(self):
+        with pytest.raises(OutOfRangeError) as exc_info:
+            validate_range(11, min_val=0, max_val=10)
+        assert str(exc_info.value) == "Value out of range [0, 10]: 11"
+        assert exc_info.value.message == "Value out of range [0, 10]"
+
+
+class TestValidateArray:
+    """Tests for validate_array function."""
+
+    def test_returns_float64_array(self):
+        result = validate_array([1, 2, 3])
+        assert result.dtype == np.float64
+        assert np.array_equal(result, [1.0, 2.0, 3.0])
+
+    def test_accepts_scalar(self):
+        assert validate_array(2.5).shape == ()
+
+    @pytest.mark.parametrize("value", [[1.0, float("nan")], [float("inf")]])
+    def test_rejects_non_finite(self, value):
+        with pytest.raises(InvalidInputError):
+            validate_array(value)
+
+    @pytest.mark.parametrize("value", [["a"], ["1"], [None], [[1.0], [1.0, 2.0]]])
+    def test_rejects_non_numeric(self, value):
+        with pytest.raises(InvalidInputError):
+            validate_array(value)
@@ -1,5 +1,6 @@
+import sys
+
 from PIL import Image
-from collections import Counter
 
 def get_dominant_colors(image_path, num_colors=3):
     try:
@@ -9,21 +10,17 @@ def get_dominant_colors(image_path, num_colors=3):
         if image.mode != 'RGB':
             image = image.convert('RGB')
         
-        pixels = list(image.getdata())
-        counts = Counter(pixels)
-        most_common = counts.most_common(num_colors)
-        
-        hex_colors = []
-        for color, count in most_common:
-            hex_color = '#{:02x}{:02x}{:02x}'.format(*color)
-            hex_colors.append((hex_color, count))
-            
-        return hex_colors
+        # Octree quantization reduces the image to num_colors palette
+        # entries in C; getcolors() then returns (count, index) pairs
+        quantized = image.quantize(colors=num_colors, method=Image.Quantize.FASTOCTREE)
+        palette = quantized.getpalette()
+        histogram = sorted(quantized.getcolors(), reverse=True)
+
+        # Each palette entry is three bytes, so bytes.hex() yields the RGB hex
+        return [('#' + bytes(palette[i * 3:i * 3 + 3]).hex(), count) for count, i in histogram]
     except Exception as e:
         print(f"Error: {e}")
         return []
 
 colors = get_dominant_colors('docs/media/logo.png', 5)
-print("Dominant Colors:")
-for hex_c, count in colors:
-    print(f"{hex_c} ({count})")
+sys.stdout.write("Dominant Colors:\n" + "".join(f"{hex_c} ({count})\n" for hex_c, count in colors))
@@ -1,3 +1,15 @@
+import hashlib
+import sys
+from pathlib import Path
+
+# Rendering forks graphviz; skip it when this script has not changed since
+# the committed PNG was produced
+OUTPUT = Path("docs/media/architecture.png")
+HASH_FILE = Path("docs/media/.architecture.sha")
+source_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+if OUTPUT.exists() and HASH_FILE.exists() and HASH_FILE.read_text().strip() == source_hash:
+    sys.exit(0)
+
 from diagrams import Cluster, Diagram, Edge
 from diagrams.onprem.ci import TravisCI # Fallback/Generic CI icon or similar
 from diagrams.onprem.database import PostgreSQL
@@ -40,3 +52,5 @@ with Diagram("Oxide CI Architecture", show=False, filename="docs/media/architect
             agent >> Edge(label="Logs/Status") >> bus
             agent >> runner
             agent >> plugins
+
+HASH_FILE.write_text(source_hash + "\n")
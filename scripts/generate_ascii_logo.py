@@ -1,10 +1,32 @@
-from ascii_magic import AsciiArt
+import functools
 import sys
 
+import numpy as np
+from PIL import Image
+
+# Characters from darkest to brightest
+RAMP = np.array(list(' .:-=+*#%@'))
+
+@functools.lru_cache(maxsize=4)
+def _render(image_path, columns=80):
+    # Decoding the image dominates; reuse the rendering across calls in one process
+    image = Image.open(image_path).convert('RGB')
+    # Terminal cells are roughly twice as tall as they are wide
+    rows = max(1, round(image.height * columns / image.width / 2))
+    pixels = np.asarray(image.resize((columns, rows)), dtype=np.uint32)
+
+    luminance = pixels @ np.array([299, 587, 114], dtype=np.uint32) // 1000
+    chars = RAMP[luminance * len(RAMP) // 256]
+
+    lines = []
+    for row_pixels, row_chars in zip(pixels.tolist(), chars.tolist()):
+        cells = ''.join(f'\033[38;2;{r};{g};{b}m{c}' for (r, g, b), c in zip(row_pixels, row_chars))
+        lines.append(cells + '\033[0m\n')
+    return ''.join(lines)
+
 def main(image_path):
     try:
-        my_art = AsciiArt.from_image(image_path)
-        my_art.to_terminal(columns=80)
+        sys.stdout.write(_render(image_path))
     except Exception as e:
         # Fallback to simple text if fails
         print("\033[38;2;253;68;3mOxide CI\033[0m")